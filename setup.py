@@ -1,4 +1,22 @@
-from distutils.core import setup
+import os
+import sys
+
+# optional: WHOIS_USE_MYPYC=1 compiles the hot path (tld matching, normalization, query) with mypyc,
+# without it (or when mypyc is not installed) the package stays pure python
+ext_modules = []
+if os.getenv("WHOIS_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("WARNING: WHOIS_USE_MYPYC=1 but mypyc is not installed, building pure python", file=sys.stderr)
+    else:
+        ext_modules = mypycify(["whois/__init__.py"])
+
+# mypycify needs setuptools, the pure python build keeps using distutils
+if ext_modules:
+    from setuptools import setup
+else:
+    from distutils.core import setup
 
 setup(
     name="whois",
@@ -11,6 +29,7 @@ setup(
     url="https://github.com/DannyCork/python-whois/",
     platforms=["any"],
     packages=["whois"],
+    ext_modules=ext_modules,
     keywords=["Python", "whois", "tld", "domain", "expiration", "cctld", "domainer", ".com", "registrar"],
     classifiers=[
         "License :: OSI Approved :: MIT License",
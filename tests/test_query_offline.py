@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+# offline tests for whois.query() and whois.aio.query_many, no whois server is contacted
+# run from the top directory: python -m unittest discover -s tests
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import whois
+from whois import _1_query
+from whois.aio import query_many
+
+RESPONSE = """Domain Name: {}
+Registrar: Example Registrar
+Creation Date: 1995-08-14T04:00:00Z
+Registry Expiry Date: 2030-08-13T04:00:00Z
+Updated Date: 2023-08-14T07:01:38Z
+Name Server: A.IANA-SERVERS.NET
+Domain Status: clientDeleteProhibited
+"""
+
+QUOTA = "% Quota exceeded, please try again later\n"
+
+
+def fakeWhois(dl, **kw):
+    return RESPONSE.format(".".join(dl).upper())
+
+
+class OfflineTestCase(unittest.TestCase):
+    # every test starts with empty caches and a whois command that answers RESPONSE
+    def setUp(self):
+        _1_query.CACHE.clear()
+        whois.RESULT_CACHE.clear()
+        whois.DYNAMIC_SLOW_DOWN.clear()
+
+        patcher = mock.patch.object(_1_query, "_do_whois_query", side_effect=fakeWhois)
+        self.whoisQuery = patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestResultCache(OfflineTestCase):
+    def test_fresh_domain_per_call(self):
+        whois.get("example.com")["name"] = "MUTATED"
+        d = whois.query("example.com")
+        self.assertEqual(d.name, "example.com")
+        self.assertIsNot(d, whois.query("example.com"))
+        self.assertEqual(self.whoisQuery.call_count, 1)
+
+    def test_key_is_normalized(self):
+        whois.query("Example.COM")
+        whois.query("example.com.")
+        whois.query("www.example.com")
+        self.assertEqual(len(whois.RESULT_CACHE), 1)
+        self.assertEqual(self.whoisQuery.call_count, 1)
+
+    def test_max_size(self):
+        with mock.patch.object(whois, "RESULT_CACHE_MAX_SIZE", 2):
+            for name in ("a.com", "b.com", "c.com"):
+                whois.query(name)
+            self.assertEqual([k[0] for k in whois.RESULT_CACHE], ["b.com", "c.com"])
+
+    def test_expired_entries_are_dropped(self):
+        whois.query("a.com")
+        key = next(iter(whois.RESULT_CACHE))
+        whois.RESULT_CACHE[key] = (0, whois.RESULT_CACHE[key][1])
+        whois.query("b.com")
+        self.assertEqual([k[0] for k in whois.RESULT_CACHE], ["b.com"])
+
+    def test_socket_response_is_cached_apart(self):
+        server = "whois.verisign-grs.com"
+        with mock.patch.object(_1_query, "_do_socket_query", side_effect=fakeWhois) as socketQuery:
+            whois.query("example.com", server=server, use_socket=True)
+            whois.query("example.com", server=server)
+            whois.query("example.com", server=server, use_socket=True, force=True)
+
+        self.assertEqual(socketQuery.call_count, 2)
+        self.assertEqual(self.whoisQuery.call_count, 1)
+        self.assertEqual(sorted(_1_query.CACHE), ["example.com", "socket:example.com"])
+
+
+class TestDynamicSlowDown(OfflineTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(_1_query.time, "sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_quota_response_is_not_cached(self):
+        self.whoisQuery.side_effect = [QUOTA, fakeWhois(["example", "com"])]
+
+        with self.assertRaises(whois.WhoisQuotaExceeded):
+            whois.query("example.com")
+        self.assertNotIn("example.com", _1_query.CACHE)
+        self.assertEqual(whois.DYNAMIC_SLOW_DOWN, {"com": 2})
+
+        # the retry reaches the server, waits the learned slow down and decays it on success
+        self.assertEqual(whois.query("example.com").name, "example.com")
+        self.assertEqual(self.whoisQuery.call_count, 2)
+        self.sleep.assert_called_once_with(2)
+        self.assertEqual(whois.DYNAMIC_SLOW_DOWN, {"com": 1})
+
+    def test_cached_quota_response_does_not_count(self):
+        for _ in range(5):
+            _1_query.CACHE["example.com"] = (int(time.time()), QUOTA)
+            with self.assertRaises(whois.WhoisQuotaExceeded):
+                whois.query("example.com")
+
+        self.whoisQuery.assert_not_called()
+        self.assertEqual(whois.DYNAMIC_SLOW_DOWN, {})
+
+    def test_cached_success_does_not_count(self):
+        whois.DYNAMIC_SLOW_DOWN["com"] = 8
+        _1_query.CACHE["example.com"] = (int(time.time()), fakeWhois(["example", "com"]))
+        for _ in range(5):
+            whois.RESULT_CACHE.clear()
+            whois.query("example.com")
+
+        self.whoisQuery.assert_not_called()
+        self.assertEqual(whois.DYNAMIC_SLOW_DOWN, {"com": 8})
+
+
+class TestQueryMany(OfflineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.whoisQuery.side_effect = self._slowWhois
+
+    def _slowWhois(self, dl, **kw):
+        self.release.wait(5)
+        return fakeWhois(dl)
+
+    def test_results_in_order(self):
+        self.release.set()
+        r = asyncio.run(query_many(["a.com", "x.unknowntld", "b.com"]))
+
+        self.assertEqual(r[0].name, "a.com")
+        self.assertIsInstance(r[1], whois.UnknownTld)
+        self.assertEqual(r[2].name, "b.com")
+
+    def test_cancel_does_not_wait_for_running_lookups(self):
+        domains = [f"d{i}.com" for i in range(8)]
+        t = time.monotonic()
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(query_many(domains), 0.1))
+        self.assertLess(time.monotonic() - t, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+# tests for the TLD_RE backtracking stress test
+# run from the top directory: python -m unittest discover -s tests
+import contextlib
+import io
+import re
+import unittest
+from unittest import mock
+
+from whois import _regex_lint
+from whois._2_parse import TLD_RE
+
+# exponential on "Domain Name: " + "a" * n + "!"
+BAD_PATTERN = r"Domain Name:(\s*\w*)*$"
+
+
+def runLint():
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        rc = _regex_lint.main([])
+    return rc, out.getvalue()
+
+
+class TestRegexLint(unittest.TestCase):
+    def test_current_patterns_pass(self):
+        rc, out = runLint()
+        self.assertEqual(rc, 0, out)
+
+    def test_nested_quantifier_is_reported(self):
+        bad = {"domain_name": re.compile(BAD_PATTERN, re.IGNORECASE)}
+        with mock.patch.dict(TLD_RE, {"zz_lint": bad}), mock.patch.object(_regex_lint, "HANG_S", 1):
+            rc, out = runLint()
+
+        self.assertEqual(rc, 1)
+        self.assertIn(repr(BAD_PATTERN), out)
+        self.assertIn("zz_lint.domain_name", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
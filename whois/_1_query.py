@@ -4,6 +4,8 @@ import sys
 import os
 import platform
 import json
+import socket
+import threading
 from .exceptions import WhoisCommandFailed
 
 from typing import Dict, List, Optional, Tuple
@@ -12,6 +14,8 @@ from typing import Dict, List, Optional, Tuple
 PYTHON_VERSION = sys.version_info[0]
 CACHE: Dict[str, Tuple[int, str]] = {}
 CACHE_MAX_AGE = 60 * 60 * 48  # 48h
+CACHE_LOCK = threading.Lock()  # do_query may run in several threads at once
+SOCKET_TIMEOUT = 30  # seconds, for use_socket
 
 
 def cache_load(cf: str) -> None:
@@ -37,6 +41,22 @@ def cache_save(cf: str) -> None:
     f.close()
 
 
+def cache_key(dl: List[str], server: Optional[str] = None, use_socket: bool = False) -> str:
+    # the socket and the whois command do not give the same response,
+    # so they must not replay each other's answers
+    k = ".".join(dl)
+    if use_socket and server:
+        return f"socket:{k}"
+    return k
+
+
+def cache_drop(k: str, cache_file: Optional[str] = None) -> None:
+    # forget a response, e.g. a quota exceeded answer that should not be replayed
+    with CACHE_LOCK:
+        if CACHE.pop(k, None) is not None and cache_file:
+            cache_save(cache_file)
+
+
 def do_query(
     dl: List[str],
     force: bool = False,
@@ -45,34 +65,96 @@ def do_query(
     ignore_returncode: bool = False,
     server: Optional[str] = None,
     verbose: bool = False,
+    use_socket: bool = False,
 ) -> str:
-    k = ".".join(dl)
+    return _do_query(
+        dl=dl,
+        force=force,
+        cache_file=cache_file,
+        slow_down=slow_down,
+        ignore_returncode=ignore_returncode,
+        server=server,
+        verbose=verbose,
+        use_socket=use_socket,
+    )[0]
+
+
+def _do_query(
+    dl: List[str],
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    use_socket: bool = False,
+) -> Tuple[str, bool]:
+    # same as do_query but also tells if the response came from the server (True) or the cache (False)
+    k = cache_key(dl, server, use_socket)
 
     if cache_file:
-        cache_load(cache_file)
+        with CACHE_LOCK:
+            cache_load(cache_file)
 
     # actually also whois uses cache, so if you really dont want to use cache
     # you should also pass the --force-lookup flag (on linux)
-    if force or k not in CACHE or CACHE[k][0] < time.time() - CACHE_MAX_AGE:
-        # slow down before so we can force individual domains at a slower tempo
-        if slow_down:
-            time.sleep(slow_down)
-
-        # populate a fresh cache entry
-        CACHE[k] = (
-            int(time.time()),
-            _do_whois_query(
-                dl=dl,
-                ignore_returncode=ignore_returncode,
-                server=server,
-                verbose=verbose,
-            ),
+    entry = CACHE.get(k)
+    if not force and entry is not None and entry[0] >= time.time() - CACHE_MAX_AGE:
+        return entry[1], False
+
+    # slow down before so we can force individual domains at a slower tempo
+    if slow_down:
+        time.sleep(slow_down)
+
+    # populate a fresh cache entry,
+    # without a server we need the whois command to find the right one for us
+    if use_socket and server:
+        r = _do_socket_query(
+            dl=dl,
+            server=server,
+            verbose=verbose,
+        )
+    else:
+        r = _do_whois_query(
+            dl=dl,
+            ignore_returncode=ignore_returncode,
+            server=server,
+            verbose=verbose,
         )
 
+    with CACHE_LOCK:
+        CACHE[k] = (int(time.time()), r)
         if cache_file:
             cache_save(cache_file)
 
-    return CACHE[k][1]
+    return r, True
+
+
+def _do_socket_query(
+    dl: List[str],
+    server: str,
+    verbose: bool = False,
+) -> str:
+    """
+    Query the whois server directly on port 43 (RFC 3912) without starting the whois command.
+    The server closes the connection after the response, so there is nothing to reuse.
+    """
+    if verbose:
+        print(f"socket query {server}:43 for {'.'.join(dl)}", file=sys.stderr)
+
+    try:
+        with socket.create_connection((server, 43), timeout=SOCKET_TIMEOUT) as s:
+            s.sendall(f"{'.'.join(dl)}\r\n".encode())
+            chunks = []
+            while True:
+                data = s.recv(4096)
+                if not data:
+                    break
+                chunks.append(data)
+    except OSError as e:
+        raise WhoisCommandFailed(f"{server}: {e}") from e
+
+    return b"".join(chunks).decode(errors="ignore")
 
 
 def _do_whois_query(
@@ -12,6 +12,28 @@ Verbose = True
 
 TLD_RE: Dict[str, Any] = {}
 
+# lowercase markers in short responses: no data for this domain
+NONE_STRINGS = (
+    "not found",
+    "no entries found",
+    "status: free",
+    "no such domain",
+    "the queried object does not exist",
+    "domain you requested is not known",
+    "status: available",
+)
+
+# lowercase markers in short responses: we asked too often
+QUOTA_STRINGS = (
+    "limit exceeded",
+    "quota exceeded",
+    "try again later",
+    "please try again",
+    "exceeded the maximum allowable number",
+    "can temporarily not be answered",
+    "queried interval is too short",
+)
+
 
 def get_tld_re(tld: str) -> Any:
     if tld in TLD_RE:
@@ -119,17 +141,7 @@ def do_parse(
 
         # NOTE: from here s is lowercase only
         # ---------------------------------
-        noneStrings = [
-            "not found",
-            "no entries found",
-            "status: free",
-            "no such domain",
-            "the queried object does not exist",
-            "domain you requested is not known",
-            "status: available",
-        ]
-
-        for i in noneStrings:
+        for i in NONE_STRINGS:
             if i in s:
                 return None
 
@@ -139,18 +151,7 @@ def do_parse(
             return None
 
         # ---------------------------------
-        quotaStrings = [
-            "limit exceeded",
-            "quota exceeded",
-            "try again later",
-            "please try again",
-            "exceeded the maximum allowable number",
-            "can temporarily not be answered",
-            "please try again.",
-            "queried interval is too short",
-        ]
-
-        for i in quotaStrings:
+        for i in QUOTA_STRINGS:
             if i in s:
                 raise WhoisQuotaExceeded(whois_str)
 
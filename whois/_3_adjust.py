@@ -10,7 +10,7 @@ PYTHON_VERSION = sys.version_info[0]
 
 class Domain:
     # make sure all fields actually exist allways
-    name: str = None
+    name: Optional[str] = None
     tld = None
     registrar = None
     registrant_country = None
@@ -23,7 +23,7 @@ class Domain:
     statuses: List = []
 
     dnssec = None
-    name_servers = []
+    name_servers: List = []
     owner = None
     abuse_contact = None
     reseller = None
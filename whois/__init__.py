@@ -27,10 +27,14 @@
 __all__ = ["query", "get"]
 
 import sys
-from functools import wraps
-from typing import Optional, List
-
-from ._1_query import do_query
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Optional, List, Tuple
+
+from ._1_query import do_query, _do_query, cache_drop, cache_key
 from ._2_parse import do_parse, TLD_RE
 from ._3_adjust import Domain
 from .exceptions import (
@@ -45,6 +49,22 @@ from .exceptions import (
 CACHE_FILE = None
 SLOW_DOWN = 0
 
+# parsed results per (domain, server, internationalized, with_cleanup_results, use_socket),
+# least recently used first; we keep the parsed dict so every caller gets a fresh Domain
+RESULT_CACHE: "OrderedDict[Tuple, Tuple[int, Optional[Dict[str, Any]]]]" = OrderedDict()
+RESULT_CACHE_MAX_AGE = 60 * 60 * 24  # 24h
+RESULT_CACHE_MAX_SIZE = 10000
+RESULT_CACHE_LOCK = threading.Lock()
+
+# slow down per tld learned from quota exceeded responses,
+# doubled on every quota exceeded and halved on every success,
+# only answers that really came from the server count, not cached ones
+DYNAMIC_SLOW_DOWN: Dict[str, int] = {}
+DYNAMIC_SLOW_DOWN_MAX = 60
+
+# TLD_RE is fully populated when _2_parse is imported and not modified afterwards
+TLD_SET = frozenset(TLD_RE)
+
 Map2Underscore = {
     ".ac.uk": "ac_uk",
     ".co.il": "co_il",
@@ -109,28 +129,32 @@ Utf8Map = {
 }
 
 
-def validTlds():
-    # --------------------------------------
+# all tld translation maps merged, the keys do not overlap
+_ALL_SUFFIX_MAP = {**Map2Underscore, **PythonKeyWordMap, **Utf8Map}
+
+
+def _buildSuffixTrie() -> Dict[str, Any]:
+    # all suffixes as one trie keyed on the reversed labels:
+    # ".ac.uk" -> {"uk": {"ac": {"$": "ac_uk"}}}
+    trie: Dict[str, Any] = {}
+    for k, v in _ALL_SUFFIX_MAP.items():
+        node = trie
+        for lbl in reversed(k.lstrip(".").split(".")):
+            node = node.setdefault(lbl, {})
+        node["$"] = v
+    return trie
+
+
+SUFFIX_TRIE = _buildSuffixTrie()
+
+# a reverse dict from the original tld translation maps,
+# with the starting . removed from the real domain
+_RMAP = {v: k.lstrip(".") for k, v in _ALL_SUFFIX_MAP.items()}
+
+
+def validTlds() -> List[str]:
     # we should map back to valid tld without underscore
-    # but remove the starting . from the real domain
-    rmap = {}  # build a reverse dict from the original tld translation maps
-    for i in Map2Underscore:
-        rmap[Map2Underscore[i]] = i.lstrip(".")
-
-    for i in PythonKeyWordMap:
-        rmap[PythonKeyWordMap[i]] = i.lstrip(".")
-
-    for i in Utf8Map:
-        rmap[Utf8Map[i]] = i.lstrip(".")
-
-    # --------------------------------------
-    tlds = []
-    for tld in TLD_RE.keys():
-        if tld in rmap:
-            tlds.append(rmap[tld])
-        else:
-            tlds.append(tld)
-    return sorted(tlds)
+    return sorted(_RMAP.get(tld, tld) for tld in TLD_RE)
 
 
 def filterTldToSupportedPattern(
@@ -143,23 +167,20 @@ def filterTldToSupportedPattern(
     # that is the "leave early" paradigm
     # also known as "dont overstay your welcome" or "don't linger"
 
-    tld = None
-
-    if len(d) > 2:
-        for i in Map2Underscore:
-            if domain.endswith(i):
-                tld = Map2Underscore[i]
-                return tld
+    tld: Optional[str] = None
 
-    for i in PythonKeyWordMap:
-        if domain.endswith(i):
-            tld = PythonKeyWordMap[i]
-            return tld
+    # walk the trie from the last label and keep the deepest match,
+    # but there must be at least one label left in front of the match
+    node = SUFFIX_TRIE
+    for lbl in reversed(d[1:]):
+        child = node.get(lbl)
+        if child is None:
+            break
+        node = child
+        tld = node.get("$", tld)
 
-    for i in Utf8Map:
-        if domain.endswith(i):
-            tld = Utf8Map[i]
-            return tld
+    if tld:
+        return tld
 
     if domain.endswith(".name"):
         # some special case with xxx.name -> domain=xxx.name and tld is name
@@ -171,19 +192,114 @@ def filterTldToSupportedPattern(
     return d[-1]
 
 
+@lru_cache(maxsize=4096)
+def _labelToPunyCode(label: str) -> str:
+    # the idna codec is slow and the same labels (mostly the tld) come back often
+    return label.encode("idna").decode() or label
+
+
 def internationalizedDomainNameToPunyCode(d: List[str]) -> List[str]:
-    return [k.encode("idna").decode() or k for k in d]
+    return [_labelToPunyCode(k) for k in d]
 
 
-def result2dict(func):
+def result2dict(func: Callable[..., Any]) -> Callable[..., Dict[str, Any]]:
     @wraps(func)
-    def _inner(*args, **kw):
+    def _inner(*args: Any, **kw: Any) -> Dict[str, Any]:
         r = func(*args, **kw)
         return r and vars(r) or {}
 
     return _inner
 
 
+def _cachedResult(key: Tuple) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    with RESULT_CACHE_LOCK:
+        entry = RESULT_CACHE.get(key)
+        if entry is None:
+            return False, None
+
+        if entry[0] < time.time() - RESULT_CACHE_MAX_AGE:
+            del RESULT_CACHE[key]
+            return False, None
+
+        RESULT_CACHE.move_to_end(key)
+        return True, entry[1]
+
+
+def _cacheResult(
+    key: Tuple,
+    pd: Optional[Dict[str, Any]],
+    verbose: bool = False,
+) -> Optional[Domain]:
+    now = int(time.time())
+    with RESULT_CACHE_LOCK:
+        RESULT_CACHE[key] = (now, pd)
+        RESULT_CACHE.move_to_end(key)
+
+        # drop the least recently used entries when full or when they are expired anyway
+        while RESULT_CACHE:
+            oldestKey, (ts, _) = next(iter(RESULT_CACHE.items()))
+            if len(RESULT_CACHE) <= RESULT_CACHE_MAX_SIZE and ts >= now - RESULT_CACHE_MAX_AGE:
+                break
+            del RESULT_CACHE[oldestKey]
+
+    return Domain(pd, verbose=verbose) if pd else None
+
+
+def _queryAndParse(
+    dl: List[str],
+    tld: str,
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    with_cleanup_results: bool = False,
+    use_socket: bool = False,
+) -> Optional[Dict[str, Any]]:
+    slowDown = max(slow_down, DYNAMIC_SLOW_DOWN.get(tld, 0))
+    if verbose and slowDown > slow_down:
+        print(f"using dynamic slowdown {slowDown} for tld: {tld}", file=sys.stderr)
+
+    fresh = False
+    try:
+        q, fresh = _do_query(
+            dl=dl,
+            force=force,
+            cache_file=cache_file,
+            slow_down=slowDown,
+            ignore_returncode=ignore_returncode,
+            server=server,
+            verbose=verbose,
+            use_socket=use_socket,
+        )
+
+        pd = do_parse(
+            whois_str=q,
+            tld=tld,
+            dl=dl,
+            verbose=verbose,
+            with_cleanup_results=with_cleanup_results,
+        )
+    except WhoisQuotaExceeded:
+        # a retry must ask the server again and not get the quota response from the cache
+        cache_drop(cache_key(dl, server, use_socket), cache_file)
+        if fresh:
+            DYNAMIC_SLOW_DOWN[tld] = min(DYNAMIC_SLOW_DOWN_MAX, max(1, slowDown) * 2)
+            if verbose:
+                print(f"quota exceeded, slowdown for tld: {tld} is now {DYNAMIC_SLOW_DOWN[tld]}", file=sys.stderr)
+        raise
+
+    # go back to the static slow down after enough successful queries
+    if fresh and tld in DYNAMIC_SLOW_DOWN:
+        if slowDown // 2 > slow_down:
+            DYNAMIC_SLOW_DOWN[tld] = slowDown // 2
+        else:
+            DYNAMIC_SLOW_DOWN.pop(tld, None)
+
+    return pd
+
+
 def query(
     domain: str,
     force: bool = False,
@@ -192,11 +308,13 @@ def query(
     ignore_returncode: bool = False,
     server: Optional[str] = None,
     verbose: bool = False,
-    with_cleanup_results=False,
+    with_cleanup_results: bool = False,
     internationalized: bool = False,
+    parallel: bool = False,
+    use_socket: bool = False,
 ) -> Optional[Domain]:
     """
-    force=True          Don't use cache.
+    force=True          Don't use cache, neither for the whois response nor for the parsed result.
     cache_file=<path>   Use file to store cache not only memory.
     slow_down=0         Time [s] it will wait after you query WHOIS database.
                         This is useful when there is a limit to the number of requests at a time.
@@ -205,31 +323,49 @@ def query(
                         propagates on Windows to whois.exe <domain> <server>
     with_cleanup_results: cleanup lines starting with % and REDACTED FOR PRIVACY
     internationalized:  if true convert internationalizedDomainNameToPunyCode
+    parallel:           if true query all progressive lookups (xxx.yyy.zzz, yyy.zzz) at the same time
+                        instead of one after the other; this sends more requests to the whois server
+    use_socket:         if true and the whois server is known (server or a _server hint)
+                        query it directly on port 43 instead of running the whois command
     """
     assert isinstance(domain, str), Exception("`domain` - must be <str>")
 
     cache_file = cache_file or CACHE_FILE
     slow_down = slow_down or SLOW_DOWN
 
-    domain = domain.lower().strip().rstrip(".")  # Remove the trailing dot to support FQDN.
-    d = domain.split(".")
+    # lower() always makes a new string, most of the time it is lowercase already
+    if not (domain.islower() and domain.isascii()):
+        domain = domain.lower()
 
-    if d[0] == "www":
-        d = d[1:]
+    domain = domain.strip().rstrip(".")  # Remove the trailing dot to support FQDN.
+    if domain.startswith("www."):
+        domain = domain[4:]
 
-    if len(d) == 1:
+    # a single label has no tld, no need to split it first
+    if "." not in domain:
         return None
 
+    # repeated lookups of the same domain do not need to query or parse again
+    cacheKey = (domain, server, internationalized, with_cleanup_results, use_socket)
+    if not force:
+        found, pd = _cachedResult(cacheKey)
+        if found:
+            if verbose:
+                print(f"using cached result for: {domain}", file=sys.stderr)
+            return Domain(pd, verbose=verbose) if pd else None
+
+    d = domain.split(".")
+
     tld = filterTldToSupportedPattern(domain, d, verbose)
 
-    if tld not in TLD_RE.keys():
+    if tld not in TLD_SET:
         a = f"The TLD {tld} is currently not supported by this package."
         b = "Use validTlds() to see what toplevel domains are supported."
         msg = f"{a} {b}"
         raise UnknownTld(msg)
 
     # allow server hints using "_server" from the tld_regexpr.py file
-    thisTld = TLD_RE.get(tld)
+    thisTld = TLD_RE[tld]
     if thisTld.get("_privateRegistry"):
         msg = "This tld has either no whois server or responds only with minimal information"
         raise WhoisPrivateRegistry(msg)
@@ -261,31 +397,45 @@ def query(
         if verbose:
             print(d, file=sys.stderr)
 
-    while 1:
-        q = do_query(
-            dl=d,
-            force=force,
-            cache_file=cache_file,
-            slow_down=slow_down,
-            ignore_returncode=ignore_returncode,
-            server=server,
-            verbose=verbose,
-        )
+    kw: Dict[str, Any] = dict(
+        tld=tld,
+        force=force,
+        cache_file=cache_file,
+        slow_down=slow_down,
+        ignore_returncode=ignore_returncode,
+        server=server,
+        verbose=verbose,
+        with_cleanup_results=with_cleanup_results,
+        use_socket=use_socket,
+    )
+
+    if parallel:
+        candidates = [d[i:] for i in range(max(1, len(d) - len(tldLevel)))]
+        if verbose:
+            print(f"try in parallel: {candidates}", file=sys.stderr)
+
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = [executor.submit(_queryAndParse, dl=c, **kw) for c in candidates]
+        try:
+            # the longest domain wins, same as in the progressive lookup below
+            for f in futures:
+                pd = f.result()
+                if pd and (pd.get("domain_name") or [""])[0]:
+                    return _cacheResult(cacheKey, pd, verbose=verbose)
+        finally:
+            for f in futures:
+                f.cancel()
+            executor.shutdown(wait=False)
+
+        return _cacheResult(cacheKey, None)
 
-        pd = do_parse(
-            whois_str=q,
-            tld=tld,
-            dl=d,
-            verbose=verbose,
-            with_cleanup_results=with_cleanup_results,
-        )
+    while 1:
+        pd = _queryAndParse(dl=d, **kw)
 
-        # do we have a result and does it have a domain name
-        if pd and pd["domain_name"][0]:
-            return Domain(
-                pd,
-                verbose=verbose,
-            )
+        # do we have a result and does it have a domain name,
+        # not all tld's define a domain_name pattern
+        if pd and (pd.get("domain_name") or [""])[0]:
+            return _cacheResult(cacheKey, pd, verbose=verbose)
 
         if len(d) > (len(tldLevel) + 1):
             d = d[1:]  # strip one element from the front and try again
@@ -294,7 +444,7 @@ def query(
             continue
 
         # no result or no domain but we can not reduce any further so we have None
-        return None
+        return _cacheResult(cacheKey, None)
 
         """
         # not a or not b == not ( a and b )
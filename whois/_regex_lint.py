@@ -0,0 +1,134 @@
+"""
+    Stress test all patterns in TLD_RE against pathological whois output
+    and report the ones that take too long (catastrophic backtracking).
+
+    Usage: python -m whois._regex_lint [-v] [timeout_ms]
+
+    The patterns run in a child process, so a pattern that hangs
+    is reported and killed instead of blocking the whole run.
+"""
+import multiprocessing
+import re
+import sys
+import time
+
+from multiprocessing.connection import Connection
+from typing import Dict, List, Tuple
+
+from ._2_parse import TLD_RE
+
+TIMEOUT_MS = 100
+HANG_S = 5  # a pattern still running after this is killed
+
+
+# nested quantifiers like (\s*\w*)*$ take exponential time on a short run of word characters
+# that fails at the end, keep it short so the child does not hang on every bad pattern
+NESTED_N = 25
+
+
+def pathologicalInputs(pattern: str) -> List[str]:
+    r = [
+        "a" * 500,
+        "1." * 200,
+        " " * 500,
+        "\t\n" * 250,
+        "a\n" * 250,
+        "a" * NESTED_N + "!",
+    ]
+
+    # most patterns start with a literal label like "Domain Name:",
+    # without it the engine gives up early and never backtracks
+    m = re.match(r"(?:\^|\\s[*+?]?)*([\w ]+:?)", pattern)
+    if m:
+        label = m.group(1)
+        r.append(label + " " * 500)
+        r.append(label + "\n" + " \n" * 250)
+        r.append(label + " " + "1." * 200 + "\n")
+        r.append(label + "\n" + "a\t\n" * 250)
+        r.append(label + " " + "a" * NESTED_N + "!")
+        r.append(label + "a" * NESTED_N + "\x00")
+        # lines separated by blank lines, the way many registries split their sections
+        r.append(label + "\na\n" * NESTED_N)
+
+    return r
+
+
+def allPatterns() -> Dict[str, List[Tuple[str, str]]]:
+    # the same pattern is shared by many tld's through "extend": test each only once
+    r: Dict[str, List[Tuple[str, str]]] = {}
+    for tld, v in TLD_RE.items():
+        for k, p in v.items():
+            if k.startswith("_") or p is None:
+                continue
+            r.setdefault(p.pattern, []).append((tld, k))
+    return r
+
+
+def _worker(patterns: List[str], start: int, conn: Connection) -> None:
+    # a pipe and not a queue: the feeder thread of a queue can not send
+    # while re holds the GIL, so the parent would blame the wrong pattern
+    for i in range(start, len(patterns)):
+        conn.send((i, None))  # started
+        p = re.compile(patterns[i], re.IGNORECASE)
+        t = time.perf_counter()
+        for s in pathologicalInputs(patterns[i]):
+            p.findall(s)
+        conn.send((i, time.perf_counter() - t))
+
+
+def lint(timeout: float, verbose: bool = False) -> List[Tuple[str, float]]:
+    patterns = sorted(allPatterns())
+    slow: List[Tuple[str, float]] = []
+
+    start = 0
+    while start < len(patterns):
+        parentConn, childConn = multiprocessing.Pipe(duplex=False)
+        proc = multiprocessing.Process(target=_worker, args=(patterns, start, childConn), daemon=True)
+        proc.start()
+        childConn.close()
+
+        current = start
+        try:
+            while True:
+                # the time is measured in the child, here we only wait for a pattern that hangs
+                if not parentConn.poll(max(HANG_S, timeout * 10)):
+                    raise TimeoutError
+                i, elapsed = parentConn.recv()
+                if elapsed is None:
+                    current = i
+                    continue
+                if elapsed > timeout:
+                    slow.append((patterns[i], elapsed))
+                elif verbose:
+                    print(f"{elapsed * 1000:8.2f} ms  {patterns[i]}", file=sys.stderr)
+                if i == len(patterns) - 1:
+                    start = len(patterns)
+                    break
+        except (TimeoutError, EOFError):
+            # the child is stuck on (or died in) the current pattern: report it and continue after it
+            slow.append((patterns[current], float("inf")))
+            start = current + 1
+        finally:
+            proc.terminate()
+            proc.join()
+            parentConn.close()
+
+    return slow
+
+
+def main(argv: List[str]) -> int:
+    verbose = "-v" in argv
+    args = [a for a in argv if a != "-v"]
+    timeout = (int(args[0]) if args else TIMEOUT_MS) / 1000
+
+    slow = lint(timeout, verbose=verbose)
+    where = allPatterns()
+    for p, elapsed in slow:
+        used = ", ".join(f"{tld}.{k}" for tld, k in where[p])
+        print(f"{elapsed * 1000:8.2f} ms  {p!r}  used in: {used}")
+
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
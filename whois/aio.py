@@ -0,0 +1,67 @@
+"""
+    asyncio interface for looking up many domains at once.
+
+    >>> import asyncio
+    >>> from whois.aio import query_many
+    >>> results = asyncio.run(query_many(["google.com", "google.nl"]))
+
+    Each domain is looked up with whois.query() in a worker thread;
+    the result list is in the same order as the domains and holds
+    a Domain, None or the exception raised for that domain.
+"""
+__all__ = ["query_many"]
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from . import filterTldToSupportedPattern, query
+from ._2_parse import TLD_RE
+from ._3_adjust import Domain
+
+
+def _serverKey(domain: str) -> str:
+    # domains going to the same whois server share one limit:
+    # the _server hint if there is one, otherwise the tld itself
+    domain = domain.lower().strip().rstrip(".")
+    d = domain.split(".")
+    tld = filterTldToSupportedPattern(domain, d)
+    return TLD_RE.get(tld, {}).get("_server") or tld
+
+
+async def query_many(
+    domains: List[str],
+    concurrency: int = 32,
+    per_server: int = 4,
+    **kw: Any,
+) -> List[Union[Optional[Domain], BaseException]]:
+    """
+    concurrency=32      Max number of lookups running at the same time.
+    per_server=4        Max number of lookups running at the same time against one whois server,
+                        most servers have a rate limit and a ban is worse than waiting.
+    **kw                Passed on to whois.query() for every domain.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    serverSems: Dict[str, asyncio.Semaphore] = {}
+
+    # no "with": its shutdown(wait=True) would block the event loop
+    # until every running whois lookup is done, also when we are cancelled
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures: List[Future] = []
+
+    async def _one(domain: str) -> Optional[Domain]:
+        server = _serverKey(domain)
+        if server not in serverSems:
+            serverSems[server] = asyncio.Semaphore(per_server)
+
+        async with serverSems[server], sem:
+            f = executor.submit(query, domain, **kw)
+            futures.append(f)
+            return await asyncio.wrap_future(f)
+
+    try:
+        return await asyncio.gather(*(_one(d) for d in domains), return_exceptions=True)
+    finally:
+        for f in futures:
+            f.cancel()
+        executor.shutdown(wait=False)
@@ -355,12 +355,12 @@ ee = {
     "domain_name": r"Domain:\nname:\s+(.+\.ee)\n",
     "registrar": r"Registrar:\nname:\s+(.+)\n",
     "registrant": r"Registrant:\nname:\s+(.+)\n",
-    "registrant_country": r"Registrant:(?:\n+.+\n*)*country:\s+(.+)\n",
-    "creation_date": r"Domain:(?:\n+.+\n*)*registered:\s+(.+)\n",
-    "expiration_date": r"Domain:(?:\n+.+\n*)*expire:\s+(.+)\n",
-    "updated_date": r"Domain:(?:\n+.+\n*)*changed:\s+(.+)\n",
+    "registrant_country": r"Registrant:(?:(?:\n+.+)+?\n+|\n[\s\S]*[^\n])?country:\s+(.+)\n",
+    "creation_date": r"Domain:(?:(?:\n+.+)+?\n+|\n[\s\S]*[^\n])?registered:\s+(.+)\n",
+    "expiration_date": r"Domain:(?:(?:\n+.+)+?\n+|\n[\s\S]*[^\n])?expire:\s+(.+)\n",
+    "updated_date": r"Domain:(?:(?:\n+.+)+?\n+|\n[\s\S]*[^\n])?changed:\s+(.+)\n",
     "name_servers": r"nserver:\s*(.+)",
-    "status": r"Domain:(?:\n+.+\n*)*status:\s+(.+)\n",
+    "status": r"Domain:(?:(?:\n+.+)+?\n+|\n[\s\S]*[^\n])?status:\s+(.+)\n",
     "emails": r"[\w.-]+@[\w.-]+\.[\w]{2,4}",
 }
 
@@ -545,7 +545,7 @@ co_jp = {
     #    'expiration_date':          r'\[状態\].+\((.+)\)',
     #    'updated_date':             r'\[最終更新\]\s?(.+)',
     "creation_date": r"\[Registered Date\]\s?(.+)",
-    "expiration_date": None,
+    "expiration_date": None,  # type: ignore[dict-item]
     "updated_date": r"\[Last Update\]\s?(.+)",
     "status": r"\[State\]\s?(.+)",
 }
@@ -1594,12 +1594,12 @@ re = {
 
 ro = {
     "extend": None,
-    "domain_name": r"\s+Domain name:\s+(.+)",
-    "registrar": r"\s+Registrar:\s+(.+)",
-    "creation_date": r"\s+Registered On:\s+(.+)",
-    "expiration_date": r"\s+Expires On:\s+(.+)",
-    "status": r"\s+Domain Status:\s(.+)",
-    "name_servers": r"\s+NameServer:\s+(.+)",
+    "domain_name": r"(?<=\s)Domain name:\s+(.+)",
+    "registrar": r"(?<=\s)Registrar:\s+(.+)",
+    "creation_date": r"(?<=\s)Registered On:\s+(.+)",
+    "expiration_date": r"(?<=\s)Expires On:\s+(.+)",
+    "status": r"(?<=\s)Domain Status:\s(.+)",
+    "name_servers": r"(?<=\s)NameServer:\s+(.+)",
     "registrant_country": None,
     "updated_date": None,
 }
@@ -1619,11 +1619,11 @@ rs = {
 sg = {
     "_server": "whois.sgnic.sg",
     "registrar": r"Registrar:\s+(.+)",
-    "domain_name": r"\s+Domain name:\s+(.+)",
-    "creation_date": r"\s+Creation Date:\s+(.+)",
+    "domain_name": r"(?<=\s)Domain name:\s+(.+)",
+    "creation_date": r"(?<=\s)Creation Date:\s+(.+)",
     "expiration_date": r":\s+Expiration Date\s+(.+)",
-    "updated_date": r"\s+Modified Date:\s+(.+)",
-    "status": r"\s+Domain Status:\s(.+)",
+    "updated_date": r"(?<=\s)Modified Date:\s+(.+)",
+    "status": r"(?<=\s)Domain Status:\s(.+)",
     "registrant_country": None,
     "name_servers": None,  # actually a multi line match: TODO
 }
@@ -1647,9 +1647,9 @@ td = {
 tw = {
     "extend": None,
     "domain_name": r"Domain Name:\s+(.+)",
-    "creation_date": r"\s+Record created on\s+(.+)",
-    "expiration_date": r"\s+Record expires on\s+(.+)",
-    "status": r"\s+Domain Status:\s+(.+)",
+    "creation_date": r"(?<=\s)Record created on\s+(.+)",
+    "expiration_date": r"(?<=\s)Record expires on\s+(.+)",
+    "status": r"(?<=\s)Domain Status:\s+(.+)",
     "registrar": r"Registration\s+Service\s+Provider:\s+(.+)",
     "updated_date": None,
     "registrant_country": None,
@@ -1706,7 +1706,7 @@ re = {
 }
 
 bo = {
-    "domain_name": r"\s*NOMBRE DE DOMINIO:\s+(.+)",
+    "domain_name": r"NOMBRE DE DOMINIO:\s+(.+)",
     "registrant_country": r"País:\s+(.+)",
     "creation_date": r"Fecha de activación:\s+(.+)",
     "expiration_date": r"Fecha de corte:\s+(.+)",